@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-import asyncio
 import logging
 import time
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import Any
 
 from homeassistant.const import EVENT_CALL_SERVICE
-from homeassistant.core import Context, Event, HomeAssistant, ServiceCall
+from homeassistant.core import Context, Event, HomeAssistant, ServiceCall, callback
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.storage import Store
 
@@ -18,10 +18,14 @@ from .const import (
     CONF_TIMEOUT,
     CONF_TRANSITION,
     DOMAIN,
+    SAVE_DELAY,
     SERVICE_CYCLE,
     SERVICE_SCENE_OFF,
     SERVICE_SCENE_ON,
+    STORAGE_CURRENT_SCENE,
+    STORAGE_ENTRIES,
     STORAGE_KEY,
+    STORAGE_LAST_ACTIVATED_AT,
     STORAGE_VERSION,
 )
 
@@ -35,6 +39,16 @@ class SequencerConfig:
     off_scene: str | None
     timeout: int | None
     transition: int
+    on_scene_positions: dict[str, int] = field(init=False, repr=False)
+    tracked_scenes: tuple[str, ...] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.on_scene_positions = {
+            scene_id: index for index, scene_id in enumerate(self.on_scenes)
+        }
+        self.tracked_scenes = tuple(self.on_scenes)
+        if self.off_scene is not None:
+            self.tracked_scenes += (self.off_scene,)
 
 
 @dataclass(slots=True)
@@ -43,6 +57,10 @@ class SequencerState:
     last_activated_at: float = 0.0
 
 
+# Read-only stand-in for entries without stored state; never mutate it.
+_DEFAULT_STATE = SequencerState()
+
+
 @dataclass(slots=True)
 class SequencerManager:
     hass: HomeAssistant
@@ -50,8 +68,8 @@ class SequencerManager:
     configs: dict[str, SequencerConfig] = field(default_factory=dict)
     states: dict[str, SequencerState] = field(default_factory=dict)
     scene_index: dict[str, set[str]] = field(default_factory=dict)
+    name_index: dict[str, set[str]] = field(default_factory=dict)
     _internal_scene_context_ids: set[str] = field(default_factory=set)
-    _lock: asyncio.Lock = field(default_factory=asyncio.Lock)
     _unsub_call_service: Any = None
 
     def __post_init__(self) -> None:
@@ -62,13 +80,13 @@ class SequencerManager:
         if not stored:
             return
 
-        entries = stored.get("entries", {}) if isinstance(stored, dict) else {}
+        entries = stored.get(STORAGE_ENTRIES, {}) if isinstance(stored, dict) else {}
         for entry_id, payload in entries.items():
             if not isinstance(payload, dict):
                 continue
             self.states[entry_id] = SequencerState(
-                current_scene=payload.get("current_scene"),
-                last_activated_at=float(payload.get("last_activated_at", 0.0)),
+                current_scene=payload.get(STORAGE_CURRENT_SCENE),
+                last_activated_at=float(payload.get(STORAGE_LAST_ACTIVATED_AT, 0.0)),
             )
 
     async def async_add_entry(self, entry_id: str, config: dict[str, Any]) -> None:
@@ -90,80 +108,84 @@ class SequencerManager:
             transition=int(config.get(CONF_TRANSITION, 0)),
         )
 
-        async with self._lock:
-            previous_config = self.configs.get(entry_id)
-            if previous_config is not None:
-                previous_scenes = list(previous_config.on_scenes)
-                if previous_config.off_scene is not None:
-                    previous_scenes.append(previous_config.off_scene)
-
-                for scene_id in previous_scenes:
-                    entry_ids = self.scene_index.get(scene_id)
-                    if entry_ids is None:
-                        continue
-                    entry_ids.discard(entry_id)
-                    if not entry_ids:
-                        self.scene_index.pop(scene_id, None)
-
-            self.configs[entry_id] = sequencer_config
-            self.states.setdefault(entry_id, SequencerState())
-            entry_scenes = list(sequencer_config.on_scenes)
-            if sequencer_config.off_scene is not None:
-                entry_scenes.append(sequencer_config.off_scene)
-
-            for scene_id in entry_scenes:
-                self.scene_index.setdefault(scene_id, set()).add(entry_id)
-            await self._async_save()
-            _LOGGER.debug(
-                "Scene Sequencer entry %s: %s (name=%s, on_scenes=%s, off_scene=%s, timeout=%s, transition=%s)",
-                entry_id,
-                log_action,
-                sequencer_config.name,
-                sequencer_config.on_scenes,
-                sequencer_config.off_scene,
-                sequencer_config.timeout,
-                sequencer_config.transition,
-            )
+        previous_config = self.configs.get(entry_id)
+        if previous_config is not None:
+            for scene_id in previous_config.tracked_scenes:
+                entry_ids = self.scene_index.get(scene_id)
+                if entry_ids is None:
+                    continue
+                entry_ids.discard(entry_id)
+                if not entry_ids:
+                    self.scene_index.pop(scene_id, None)
+
+            named_entry_ids = self.name_index.get(previous_config.name)
+            if named_entry_ids is not None:
+                named_entry_ids.discard(entry_id)
+                if not named_entry_ids:
+                    self.name_index.pop(previous_config.name, None)
+
+        self.configs[entry_id] = sequencer_config
+        self.name_index.setdefault(sequencer_config.name, set()).add(entry_id)
+        for scene_id in sequencer_config.tracked_scenes:
+            self.scene_index.setdefault(scene_id, set()).add(entry_id)
+
+        # Config is not persisted here, and a fresh state has no current scene
+        # so it is left out of the saved document; nothing to save.
+        self.states.setdefault(entry_id, SequencerState())
+        _LOGGER.debug(
+            "Scene Sequencer entry %s: %s (name=%s, on_scenes=%s, off_scene=%s, timeout=%s, transition=%s)",
+            entry_id,
+            log_action,
+            sequencer_config.name,
+            sequencer_config.on_scenes,
+            sequencer_config.off_scene,
+            sequencer_config.timeout,
+            sequencer_config.transition,
+        )
 
     async def async_remove_entry(self, entry_id: str) -> None:
-        async with self._lock:
-            config = self.configs.pop(entry_id, None)
-            self.states.pop(entry_id, None)
-            if config is not None:
-                entry_scenes = list(config.on_scenes)
-                if config.off_scene is not None:
-                    entry_scenes.append(config.off_scene)
-
-                for scene_id in entry_scenes:
-                    entry_ids = self.scene_index.get(scene_id)
-                    if entry_ids is None:
-                        continue
-                    entry_ids.discard(entry_id)
-                    if not entry_ids:
-                        self.scene_index.pop(scene_id, None)
-            await self._async_save()
-            _LOGGER.debug("Scene Sequencer entry removed: %s", entry_id)
+        config = self.configs.pop(entry_id, None)
+        removed_state = self.states.pop(entry_id, None)
+        if config is not None:
+            for scene_id in config.tracked_scenes:
+                entry_ids = self.scene_index.get(scene_id)
+                if entry_ids is None:
+                    continue
+                entry_ids.discard(entry_id)
+                if not entry_ids:
+                    self.scene_index.pop(scene_id, None)
+
+            named_entry_ids = self.name_index.get(config.name)
+            if named_entry_ids is not None:
+                named_entry_ids.discard(entry_id)
+                if not named_entry_ids:
+                    self.name_index.pop(config.name, None)
+        if removed_state is not None and removed_state.current_scene is not None:
+            self._async_schedule_save()
+        _LOGGER.debug("Scene Sequencer entry removed: %s", entry_id)
 
     async def async_handle_service_call(self, call: ServiceCall) -> None:
         entry_id = self._resolve_service_target_entry_id(call)
         if not entry_id:
             return
 
-        async with self._lock:
-            config = self.configs.get(entry_id)
-            if config is None:
-                _LOGGER.warning("Service call for unknown entry_id: %s", entry_id)
-                return
-
-            state = self.states.setdefault(entry_id, SequencerState())
-            backward = bool(call.data.get("backward", False))
-            target_scene = self._resolve_target_scene(config, state, backward=backward)
-            if target_scene is None:
-                _LOGGER.warning(
-                    "Could not resolve target scene for entry_id=%s. Check on_scenes configuration.",
-                    entry_id,
-                )
-                return
+        config = self.configs.get(entry_id)
+        if config is None:
+            _LOGGER.warning("Service call for unknown entry_id: %s", entry_id)
+            return
+
+        now = time.time()
+        state = self.states.get(entry_id) or _DEFAULT_STATE
+        backward = bool(call.data.get("backward", False))
+        target_scene = self._resolve_target_scene(
+            config, state, now, backward=backward
+        )
+        if target_scene is None:
+            _LOGGER.warning(
+                "Could not resolve target scene for entry_id=%s. Check on_scenes configuration.",
+                entry_id,
+            )
+            return
 
         await self._async_activate_scene(
             entry_id=entry_id,
@@ -172,6 +194,7 @@ class SequencerManager:
             transition=config.transition,
             parent_context_id=call.context.id,
             source_service=SERVICE_CYCLE,
+            now=now,
         )
 
     async def async_handle_scene_on_call(self, call: ServiceCall) -> None:
@@ -179,30 +202,29 @@ class SequencerManager:
         if not entry_id:
             return
 
-        async with self._lock:
-            config = self.configs.get(entry_id)
-            if config is None:
-                _LOGGER.warning("scene_on call for unknown entry_id: %s", entry_id)
-                return
+        config = self.configs.get(entry_id)
+        if config is None:
+            _LOGGER.warning("scene_on call for unknown entry_id: %s", entry_id)
+            return
 
-            state = self.states.setdefault(entry_id, SequencerState())
-            if state.current_scene in config.on_scenes:
-                _LOGGER.debug(
-                    "scene_on no-op for entry %s(%s): already on scene=%s",
-                    entry_id,
-                    config.name,
-                    state.current_scene,
-                )
-                return
+        state = self.states.get(entry_id) or _DEFAULT_STATE
+        if state.current_scene in config.on_scene_positions:
+            _LOGGER.debug(
+                "scene_on no-op for entry %s(%s): already on scene=%s",
+                entry_id,
+                config.name,
+                state.current_scene,
+            )
+            return
 
-            if not config.on_scenes:
-                _LOGGER.warning(
-                    "scene_on could not resolve target scene for entry_id=%s. Check on_scenes configuration.",
-                    entry_id,
-                )
-                return
+        if not config.on_scenes:
+            _LOGGER.warning(
+                "scene_on could not resolve target scene for entry_id=%s. Check on_scenes configuration.",
+                entry_id,
+            )
+            return
 
-            target_scene = config.on_scenes[0]
+        target_scene = config.on_scenes[0]
 
         await self._async_activate_scene(
             entry_id=entry_id,
@@ -211,6 +233,7 @@ class SequencerManager:
             transition=config.transition,
             parent_context_id=call.context.id,
             source_service=SERVICE_SCENE_ON,
+            now=time.time(),
         )
 
     async def async_handle_scene_off_call(self, call: ServiceCall) -> None:
@@ -218,20 +241,19 @@ class SequencerManager:
         if not entry_id:
             return
 
-        async with self._lock:
-            config = self.configs.get(entry_id)
-            if config is None:
-                _LOGGER.warning("scene_off call for unknown entry_id: %s", entry_id)
-                return
+        config = self.configs.get(entry_id)
+        if config is None:
+            _LOGGER.warning("scene_off call for unknown entry_id: %s", entry_id)
+            return
 
-            if not config.off_scene:
-                _LOGGER.warning(
-                    "scene_off called for entry_id=%s but no off_scene is configured",
-                    entry_id,
-                )
-                return
+        if not config.off_scene:
+            _LOGGER.warning(
+                "scene_off called for entry_id=%s but no off_scene is configured",
+                entry_id,
+            )
+            return
 
-            target_scene = config.off_scene
+        target_scene = config.off_scene
 
         await self._async_activate_scene(
             entry_id=entry_id,
@@ -240,6 +262,7 @@ class SequencerManager:
             transition=config.transition,
             parent_context_id=call.context.id,
             source_service=SERVICE_SCENE_OFF,
+            now=time.time(),
         )
 
     async def _async_activate_scene(
@@ -250,32 +273,34 @@ class SequencerManager:
         transition: int,
         parent_context_id: str | None,
         source_service: str,
+        now: float,
     ) -> None:
         # Apply the activation to all entries tracking this scene so shared-scene
         # sequences stay in sync for internal service calls.
-        async with self._lock:
-            now = time.time()
-            updated_entries = 0
-            for related_entry_id in self.scene_index.get(target_scene, set()):
-                related_state = self.states.setdefault(
-                    related_entry_id, SequencerState()
-                )
-                related_state.current_scene = target_scene
-                related_state.last_activated_at = now
-                updated_entries += 1
-
-            await self._async_save()
-            _LOGGER.debug(
-                "%s handled for entry %s(%s): target_scene=%s, updated_entries=%d",
-                source_service,
-                entry_id,
-                entry_name,
-                target_scene,
-                updated_entries,
-            )
+        updated_entries = 0
+        states = self.states
+        for related_entry_id in self.scene_index.get(target_scene, ()):
+            related_state = states.get(related_entry_id)
+            if related_state is None:
+                related_state = states[related_entry_id] = SequencerState()
+            related_state.current_scene = target_scene
+            related_state.last_activated_at = now
+            updated_entries += 1
+
+        if updated_entries:
+            self._async_schedule_save()
+        _LOGGER.debug(
+            "%s handled for entry %s(%s): target_scene=%s, updated_entries=%d",
+            source_service,
+            entry_id,
+            entry_name,
+            target_scene,
+            updated_entries,
+        )
 
         scene_context = Context(parent_id=parent_context_id)
-        self._internal_scene_context_ids.add(str(scene_context.id))
+        scene_context_id = scene_context.id
+        self._internal_scene_context_ids.add(scene_context_id)
 
         try:
             await self.hass.services.async_call(
@@ -286,7 +311,7 @@ class SequencerManager:
                 context=scene_context,
             )
         finally:
-            self._internal_scene_context_ids.discard(str(scene_context.id))
+            self._internal_scene_context_ids.discard(scene_context_id)
 
         _LOGGER.debug(
             "Scene activated by %s for entry %s: scene=%s, transition=%s seconds",
@@ -297,21 +322,17 @@ class SequencerManager:
         )
 
     def _resolve_service_target_entry_id(self, call: ServiceCall) -> str | None:
-        entry_id = str(call.data.get("entry_id", "")).strip()
-        name = str(call.data.get("name", "")).strip()
-
+        data = call.data
+        entry_id = str(data.get("entry_id", "")).strip()
         if entry_id:
             return entry_id
 
+        name = str(data.get("name", "")).strip()
         if not name:
             _LOGGER.warning("Service call received without entry_id or name")
             return None
 
-        matching_entry_ids = [
-            configured_entry_id
-            for configured_entry_id, config in self.configs.items()
-            if config.name == name
-        ]
+        matching_entry_ids = self.name_index.get(name)
 
         if not matching_entry_ids:
             _LOGGER.warning("Service call for unknown entry name: %s", name)
@@ -321,25 +342,17 @@ class SequencerManager:
             _LOGGER.warning(
                 "Service call entry name is ambiguous: %s (matches=%s)",
                 name,
-                matching_entry_ids,
+                sorted(matching_entry_ids),
             )
             return None
 
-        return matching_entry_ids[0]
-
-    async def async_handle_scene_service_event(self, event: Event) -> None:
-        if (
-            event.data.get("domain") != "scene"
-            or event.data.get("service") != "turn_on"
-        ):
-            return
+        return next(iter(matching_entry_ids))
 
+    @callback
+    def async_handle_scene_service_event(self, event: Event) -> None:
         context_id = event.context.id
-        if (
-            context_id is not None
-            and str(context_id) in self._internal_scene_context_ids
-        ):
-            self._internal_scene_context_ids.discard(str(context_id))
+        if context_id in self._internal_scene_context_ids:
+            self._internal_scene_context_ids.discard(context_id)
             _LOGGER.debug(
                 "Ignored internal scene activation event: context_id=%s",
                 context_id,
@@ -352,53 +365,61 @@ class SequencerManager:
             _LOGGER.debug("Scene service event received but no scene_id found")
             return
 
-        async with self._lock:
-            changed = False
-            now = time.time()
-            for scene_id in scene_ids:
-                entry_ids = self.scene_index.get(scene_id)
-                if not entry_ids:
-                    _LOGGER.debug(
-                        "Scene activated externally but no entry tracking it: %s",
-                        scene_id,
-                    )
-                    continue
+        changed = False
+        now = time.time()
+        scene_index = self.scene_index
+        states = self.states
+        for scene_id in scene_ids:
+            entry_ids = scene_index.get(scene_id)
+            if not entry_ids:
+                _LOGGER.debug(
+                    "Scene activated externally but no entry tracking it: %s",
+                    scene_id,
+                )
+                continue
 
-                for entry_id in entry_ids:
-                    state = self.states.setdefault(entry_id, SequencerState())
-                    state.current_scene = scene_id
-                    state.last_activated_at = now
-                    changed = True
-                    _LOGGER.debug(
-                        "External scene activation detected for entry %s: scene=%s",
-                        entry_id,
-                        scene_id,
-                    )
+            for entry_id in entry_ids:
+                state = states.get(entry_id)
+                if state is None:
+                    state = states[entry_id] = SequencerState()
+                state.current_scene = scene_id
+                state.last_activated_at = now
+            changed = True
+            _LOGGER.debug(
+                "External scene activation detected for entries %s: scene=%s",
+                entry_ids,
+                scene_id,
+            )
 
-            if changed:
-                await self._async_save()
+        if changed:
+            self._async_schedule_save()
 
     def _resolve_target_scene(
-        self, config: SequencerConfig, state: SequencerState, backward: bool = False
+        self,
+        config: SequencerConfig,
+        state: SequencerState,
+        now: float,
+        backward: bool = False,
     ) -> str | None:
         if not config.on_scenes:
             return None
 
+        current_scene, last_activated_at = state.current_scene, state.last_activated_at
         first_index = -1 if backward else 0
-        if config.off_scene and state.current_scene == config.off_scene:
+        if config.off_scene and current_scene == config.off_scene:
             return config.on_scenes[first_index]
 
-        if state.current_scene in config.on_scenes:
+        current_index = config.on_scene_positions.get(current_scene)
+        if current_index is not None:
             if (
                 config.off_scene
                 and config.timeout is not None
-                and state.last_activated_at > 0
-                and (time.time() - state.last_activated_at) >= config.timeout
+                and last_activated_at > 0
+                and (now - last_activated_at) >= config.timeout
             ):
                 return config.off_scene
 
             index_increment = -1 if backward else 1
-            current_index = config.on_scenes.index(state.current_scene)
             if config.off_scene:
                 if backward:
                     if current_index == 0:
@@ -408,27 +429,36 @@ class SequencerManager:
                         return config.off_scene
                 return config.on_scenes[current_index + index_increment]
 
-            # No off_scene configured: always cycle through on_scenes.
-            return config.on_scenes[
-                (current_index + index_increment) % len(config.on_scenes)
-            ]
+            # No off_scene configured: always cycle through on_scenes. Stepping
+            # back from the first scene yields -1, which already wraps to the end.
+            next_index = current_index + index_increment
+            if next_index == len(config.on_scenes):
+                next_index = 0
+            return config.on_scenes[next_index]
 
         return config.on_scenes[first_index]
 
-    async def _async_save(self) -> None:
-        data = {
-            "entries": {
+    @callback
+    def _async_schedule_save(self) -> None:
+        self.store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict[str, Any]]:
+        return {
+            STORAGE_ENTRIES: {
                 entry_id: {
-                    "current_scene": state.current_scene,
-                    "last_activated_at": state.last_activated_at,
+                    STORAGE_CURRENT_SCENE: state.current_scene,
+                    STORAGE_LAST_ACTIVATED_AT: state.last_activated_at,
                 }
                 for entry_id, state in self.states.items()
+                if state.current_scene is not None
             }
         }
-        await self.store.async_save(data)
 
     @staticmethod
     def _normalize_entity_ids(value: Any) -> list[str]:
+        if not value:
+            return []
         if isinstance(value, str):
             return [value]
         if isinstance(value, list):
@@ -436,6 +466,14 @@ class SequencerManager:
         return []
 
 
+@callback
+def _async_filter_scene_turn_on(event_data: Mapping[str, Any]) -> bool:
+    return (
+        event_data.get("domain") == "scene"
+        and event_data.get("service") == "turn_on"
+    )
+
+
 async def async_setup(hass: HomeAssistant, config: dict[str, Any]) -> bool:
     del config
 
@@ -457,7 +495,9 @@ async def async_setup(hass: HomeAssistant, config: dict[str, Any]) -> bool:
     )
     _LOGGER.debug("Scene Sequencer service registered")
     manager._unsub_call_service = hass.bus.async_listen(
-        EVENT_CALL_SERVICE, manager.async_handle_scene_service_event
+        EVENT_CALL_SERVICE,
+        manager.async_handle_scene_service_event,
+        event_filter=_async_filter_scene_turn_on,
     )
     _LOGGER.debug("Scene Sequencer event listener registered")
     return True
@@ -12,5 +12,10 @@ SERVICE_SCENE_OFF = "scene_off"
 
 STORAGE_KEY = f"{DOMAIN}.state"
 STORAGE_VERSION = 1
+SAVE_DELAY = 1
+
+STORAGE_ENTRIES = "entries"
+STORAGE_CURRENT_SCENE = "current_scene"
+STORAGE_LAST_ACTIVATED_AT = "last_activated_at"
 
 DEFAULT_TIMEOUT = 5